@@ -0,0 +1,130 @@
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+# Adaptive retry mode adds client-side rate limiting on top of backoff, so the
+# worker pool slows down on its own when Lambda starts returning throttles.
+custom_retry_config = Config(
+    retries={
+        'max_attempts': 10,
+        'mode': 'adaptive'
+    }
+)
+
+logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+REGIONS = ['us-east-1', 'us-west-2', 'eu-central-1']  # add more regions as required
+TARGET_UPDATE_RUNTIME_ON = 'Auto'
+MAX_WORKERS = 16
+
+
+def create_client(region):
+    """Create a Lambda client for the region with the custom retry configuration."""
+    return boto3.client('lambda', region_name=region, config=custom_retry_config)
+
+
+def list_functions(client):
+    """Return the names of all zip-packaged functions in the client's region."""
+    paginator = client.get_paginator('list_functions')
+    function_names = []
+    for page in paginator.paginate():
+        for function in page['Functions']:
+            # Container image functions do not support runtime management
+            if function.get('PackageType', 'Zip') == 'Zip':
+                function_names.append(function['FunctionName'])
+    return function_names
+
+
+def reconcile_function(client, region, function_name, target, dry_run):
+    """Bring one function's runtime management config in line with the target.
+
+    Returns 'changed' or 'unchanged'; AWS errors are left to the caller.
+    """
+    current = client.get_runtime_management_config(FunctionName=function_name)
+    if current.get('UpdateRuntimeOn') == target:
+        return 'unchanged'
+
+    if dry_run:
+        logger.info(f"[dry-run] Would update {function_name} in {region}: {current.get('UpdateRuntimeOn')} -> {target}")
+    else:
+        client.put_runtime_management_config(
+            FunctionName=function_name,
+            UpdateRuntimeOn=target
+        )
+        logger.info(f"Updated {function_name} in {region}: {current.get('UpdateRuntimeOn')} -> {target}")
+    return 'changed'
+
+
+def reconcile_fleet(regions, target=TARGET_UPDATE_RUNTIME_ON, dry_run=False, max_workers=MAX_WORKERS):
+    """Reconcile the runtime management config of every function across regions.
+
+    Regions are listed and functions reconciled concurrently on one bounded
+    worker pool; only functions whose config has drifted are written.
+    """
+    clients = {region: create_client(region) for region in regions}
+    summary = {'changed': [], 'unchanged': [], 'failed': []}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listing_futures = {executor.submit(list_functions, clients[region]): region for region in regions}
+        reconcile_futures = {}
+        for future in as_completed(listing_futures):
+            region = listing_futures[future]
+            try:
+                function_names = future.result()
+            except (BotoCoreError, ClientError) as e:
+                logger.error(f"Error listing Lambda functions in {region}: {str(e)}")
+                summary['failed'].append({'Region': region, 'FunctionName': None, 'Error': str(e)})
+                continue
+
+            logger.info(f"Found {len(function_names)} Lambda functions in {region}")
+            for function_name in function_names:
+                reconcile_future = executor.submit(
+                    reconcile_function, clients[region], region, function_name, target, dry_run
+                )
+                reconcile_futures[reconcile_future] = (region, function_name)
+
+        for future in as_completed(reconcile_futures):
+            region, function_name = reconcile_futures[future]
+            try:
+                status = future.result()
+            except (BotoCoreError, ClientError) as e:
+                logger.error(f"Error reconciling {function_name} in {region}: {str(e)}")
+                summary['failed'].append({'Region': region, 'FunctionName': function_name, 'Error': str(e)})
+                continue
+            summary[status].append({'Region': region, 'FunctionName': function_name})
+
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Set the Lambda runtime management config across regions, writing only drifted functions.'
+    )
+    parser.add_argument('--regions', nargs='+', default=REGIONS, help='Regions to reconcile')
+    parser.add_argument('--update-runtime-on', default=TARGET_UPDATE_RUNTIME_ON, choices=['Auto', 'FunctionUpdate'],
+                        help='Desired UpdateRuntimeOn mode')
+    parser.add_argument('--max-workers', type=int, default=MAX_WORKERS, help='Maximum concurrent Lambda API calls')
+    parser.add_argument('--dry-run', action='store_true', help='Report drift without updating any function')
+    args = parser.parse_args()
+
+    summary = reconcile_fleet(args.regions, args.update_runtime_on, args.dry_run, args.max_workers)
+
+    prefix = '[dry-run] ' if args.dry_run else ''
+    logger.info(f"{prefix}Changed: {len(summary['changed'])}")
+    logger.info(f"{prefix}Unchanged: {len(summary['unchanged'])}")
+    logger.info(f"{prefix}Failed: {len(summary['failed'])}")
+    for failure in summary['failed']:
+        logger.info(f"{prefix}  {failure['Region']} {failure['FunctionName'] or '(listing)'}: {failure['Error']}")
+
+    if summary['failed']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()